@@ -0,0 +1,77 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def compute_metrics(speed, brake, throttle, ngear, t_s):
+    """Compute all four style metrics in a single pass over raw telemetry arrays.
+
+    Fuses braking aggressiveness, throttle smoothness, cornering consistency
+    and gear shift frequency into one loop so the telemetry is traversed once
+    instead of four times. Standard deviations use Welford's single-pass
+    algorithm (ddof=1, matching pandas' .std()).
+
+    Returns a (braking_g, throttle_std, corner_std, gear_freq) tuple.
+    """
+    n = speed.shape[0]
+
+    # Braking deceleration accumulator
+    decel_sum = 0.0
+    decel_count = 0
+
+    # Welford accumulators for abs throttle change
+    th_count = 0
+    th_mean = 0.0
+    th_m2 = 0.0
+
+    # Welford accumulators for cornering speeds
+    c_count = 0
+    c_mean = 0.0
+    c_m2 = 0.0
+
+    shifts = 0
+
+    for i in range(1, n):
+        ds = speed[i] - speed[i - 1]
+        dt = t_s[i] - t_s[i - 1]
+
+        # Braking events: brake applied while speed is decreasing
+        if brake[i] > 0 and ds < 0 and dt > 0:
+            decel_sum += -(ds / 3.6) / dt
+            decel_count += 1
+
+        # Throttle smoothness: abs change between consecutive samples
+        dth = abs(throttle[i] - throttle[i - 1])
+        th_count += 1
+        delta = dth - th_mean
+        th_mean += delta / th_count
+        th_m2 += delta * (dth - th_mean)
+
+        # Cornering sections: low throttle with meaningful speed change
+        if throttle[i] < 50.0 and abs(ds) > 1.0:
+            c_count += 1
+            delta = speed[i] - c_mean
+            c_mean += delta / c_count
+            c_m2 += delta * (speed[i] - c_mean)
+
+        if ngear[i] != ngear[i - 1]:
+            shifts += 1
+
+    braking_g = decel_sum / decel_count / 9.81 if decel_count > 0 else 0.0
+    throttle_std = np.sqrt(th_m2 / (th_count - 1)) if th_count > 1 else 0.0
+    corner_std = np.sqrt(c_m2 / (c_count - 1)) if c_count > 1 else 0.0
+
+    total_minutes = (t_s[n - 1] - t_s[0]) / 60.0 if n > 1 else 0.0
+    gear_freq = shifts / total_minutes if total_minutes > 0 else 0.0
+
+    return braking_g, throttle_std, corner_std, gear_freq
+
+
+def warmup():
+    """Trigger JIT compilation with a dummy call so the first analysis is fast
+
+    The dtypes mirror the downcast telemetry columns so the warmed signature
+    is the one real calls hit.
+    """
+    z = np.zeros(2, dtype=np.float32)
+    compute_metrics(z, z, z, np.zeros(2, dtype=np.int16), np.array([0.0, 1.0]))
@@ -1,22 +1,54 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import fastf1
 import warnings
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 warnings.filterwarnings('ignore')
 
-# Configure FastF1 cache - create organized directory structure
+# Fused Numba kernel for the style metrics; fall back to the per-metric
+# pandas functions below if numba isn't available
+try:
+    from _numba import compute_metrics, warmup as _warmup_kernel
+
+    @st.cache_resource(show_spinner=False)
+    def _warm_kernel():
+        """One-time JIT warmup per server process; cache=True on the kernel
+        persists the compiled code across restarts as well"""
+        _warmup_kernel()
+        return True
+
+    _warm_kernel()
+except ImportError:
+    compute_metrics = None
+
+# Polars lazy backend: one fused query plan over the telemetry columns,
+# used when numba isn't available
+try:
+    from _polars import compute_metrics_lazy
+except ImportError:
+    compute_metrics_lazy = None
+
+# Organized cache directory structure for FastF1
 data_dir = 'data'
 cache_dir = os.path.join(data_dir, 'cache')
 if not os.path.exists(data_dir):
     os.makedirs(data_dir)
 if not os.path.exists(cache_dir):
     os.makedirs(cache_dir)
-fastf1.Cache.enable_cache(cache_dir)
+
+# FastF1 pulls in heavy dependencies; import it lazily on first use so the
+# sidebar paints fast on cold start
+_fastf1 = None
+
+def _get_fastf1():
+    global _fastf1
+    if _fastf1 is None:
+        import fastf1
+        fastf1.Cache.enable_cache(cache_dir)
+        _fastf1 = fastf1
+    return _fastf1
 
 # Page configuration
 st.set_page_config(
@@ -53,108 +85,314 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def load_session_data(year, gp, session_type):
-    """Load F1 session data using FastF1"""
-    try:
-        session = fastf1.get_session(year, gp, session_type)
-        session.load()
-        return session
-    except Exception as e:
-        st.error(f"Error loading session data: {str(e)}")
-        return None
+# Persistent store for computed metric tuples: the metrics are pure
+# functions of (year, gp, session, driver), so once computed they can be
+# looked up without re-parsing telemetry
+_metrics_store = os.path.join(cache_dir, 'metrics.parquet')
+_metric_columns = ['braking_aggressiveness', 'throttle_smoothness',
+                   'cornering_consistency', 'gear_shift_frequency']
+_metrics_df = None
+_metrics_lock = threading.Lock()
 
-def get_driver_telemetry(session, driver_code):
-    """Get telemetry data for a specific driver"""
-    try:
-        driver = session.laps.pick_driver(driver_code)
-        if driver.empty:
-            return None
-        
-        # Get fastest lap telemetry
-        fastest_lap = driver.pick_fastest()
-        if fastest_lap.empty:
+def _load_metrics_store():
+    global _metrics_df
+    if _metrics_df is None:
+        if os.path.exists(_metrics_store):
+            _metrics_df = pd.read_parquet(_metrics_store)
+        else:
+            _metrics_df = pd.DataFrame(
+                columns=['year', 'gp', 'session', 'driver', 'lap_time_ns'] + _metric_columns)
+    return _metrics_df
+
+def _lookup_metrics(year, gp, session_type, driver_code):
+    """Return (metrics dict, lap info dict) for a previously computed key"""
+    with _metrics_lock:
+        store = _load_metrics_store()
+        hit = store[(store['year'] == year) & (store['gp'] == gp) &
+                    (store['session'] == session_type) & (store['driver'] == driver_code)]
+        if hit.empty:
             return None
-            
-        telemetry = fastest_lap.get_telemetry()
-        return telemetry, fastest_lap
-    except Exception as e:
-        st.error(f"Error getting telemetry for {driver_code}: {str(e)}")
+        row = hit.iloc[-1]
+        metrics = {name: float(row[name]) for name in _metric_columns}
+        return metrics, {'LapTime': pd.Timedelta(int(row['lap_time_ns']))}
+
+def _store_metrics(year, gp, session_type, driver_code, metrics, lap):
+    global _metrics_df
+    row = {'year': year, 'gp': gp, 'session': session_type, 'driver': driver_code,
+           'lap_time_ns': pd.Timedelta(lap['LapTime']).value, **metrics}
+    with _metrics_lock:
+        _metrics_df = pd.concat([_load_metrics_store(), pd.DataFrame([row])],
+                                ignore_index=True)
+        # Atomic rewrite so a crash mid-write can't corrupt the store
+        tmp = _metrics_store + '.tmp'
+        try:
+            _metrics_df.to_parquet(tmp)
+            os.replace(tmp, _metrics_store)
+        except OSError:
+            pass  # persisting the derived cache is best-effort
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _schedule(year):
+    """Get the event names for a season, cached for a day"""
+    schedule = _get_fastf1().get_event_schedule(year)
+    return schedule['EventName'].tolist()
+
+@st.cache_resource(show_spinner=False)
+def _load_session(year, gp, session_type):
+    """Load and keep the (non-picklable) FastF1 Session object in memory"""
+    session = _get_fastf1().get_session(year, gp, session_type)
+    session.load()
+    return session
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_session_data(year, gp, session_type):
+    """Load F1 session laps using FastF1, cached across reruns and restarts"""
+    session = _load_session(year, gp, session_type)
+    return pd.DataFrame(session.laps)
+
+@st.cache_data(show_spinner=False)
+def _fastest_lap_indices(year, gp, session_type):
+    """Map each driver code to the row index of their fastest lap"""
+    laps = _load_session(year, gp, session_type).laps
+    valid = laps.dropna(subset=['LapTime'])
+    return valid.groupby('Driver')['LapTime'].idxmin().to_dict()
+
+@st.cache_data(persist="disk", show_spinner=False)
+def get_driver_telemetry(year, gp, session_type, driver_code):
+    """Get fastest-lap telemetry for a driver, cached across reruns and restarts
+
+    Returns (telemetry DataFrame, lap info dict); on a cache hit the FastF1
+    session is never loaded at all.
+    """
+    # One groupby per session instead of a pick_driver + pick_fastest scan
+    # of the laps frame per driver
+    lap_index = _fastest_lap_indices(year, gp, session_type).get(driver_code)
+    if lap_index is None:
         return None, None
 
+    fastest_lap = _load_session(year, gp, session_type).laps.loc[lap_index]
+    telemetry = fastest_lap.get_telemetry()
+
+    # Halve the column widths up front; the metric kernels are memory-bound
+    telemetry = telemetry.astype(
+        {'Speed': 'float32', 'Throttle': 'float32', 'Brake': 'float32', 'nGear': 'int16'},
+        copy=False)
+    return telemetry, fastest_lap.to_dict()
+
+# Columns the style metrics need; checked up front instead of wrapping each
+# metric in a blanket try/except that would hide real bugs
+_required_columns = {'Speed', 'Brake', 'Time', 'Throttle', 'nGear'}
+
+def _telemetry_ok(telemetry):
+    """Check the telemetry has the required columns and enough samples to diff"""
+    return _required_columns.issubset(telemetry.columns) and len(telemetry) >= 2
+
+def _time_ns(telemetry):
+    """View the Time column as int64 nanoseconds without Timedelta boxing"""
+    return telemetry['Time'].to_numpy('timedelta64[ns]').view('int64')
+
+def _as_arrays(telemetry):
+    """Extract Speed, Brake and Time columns as raw numpy arrays (Time in ns)"""
+    speed = telemetry['Speed'].to_numpy()
+    brake = telemetry['Brake'].to_numpy()
+    return speed, brake, _time_ns(telemetry)
+
+# Reusable per-thread diff buffers; telemetry lengths barely vary between
+# laps, so under Streamlit's frequent reruns this keeps the metric functions
+# from hitting the allocator on every call
+_scratch_local = threading.local()
+
+def _scratch(name, n, dtype):
+    """Get a reusable buffer of at least n elements for the named slot"""
+    buffers = getattr(_scratch_local, 'buffers', None)
+    if buffers is None:
+        buffers = _scratch_local.buffers = {}
+    key = (name, np.dtype(dtype))
+    buf = buffers.get(key)
+    if buf is None or buf.shape[0] < n:
+        buf = buffers[key] = np.empty(n, dtype=dtype)
+    return buf[:n]
+
 def calculate_braking_aggressiveness(telemetry):
     """Calculate average deceleration G-force during braking events"""
-    try:
-        # Identify braking events (where brake is applied and speed is decreasing)
-        braking_mask = (telemetry['Brake'] > 0) & (telemetry['Speed'].diff() < 0)
-        
-        if not braking_mask.any():
-            return 0.0
-        
-        # Calculate deceleration (negative acceleration)
-        speed_ms = telemetry['Speed'] / 3.6  # Convert km/h to m/s
-        acceleration = speed_ms.diff() / telemetry['Time'].diff().dt.total_seconds()
-        
-        # Get braking deceleration (positive values)
-        braking_decel = -acceleration[braking_mask]
-        braking_g_force = braking_decel / 9.81  # Convert to G-force
-        
-        return braking_g_force.mean()
-    except:
+    if not _telemetry_ok(telemetry):
+        return 0.0
+
+    speed, brake, t_ns = _as_arrays(telemetry)
+
+    # Single diff pass shared by the braking mask and the deceleration,
+    # written into reusable scratch buffers
+    ds = _scratch('speed_diff', len(speed) - 1, speed.dtype)
+    np.subtract(speed[1:], speed[:-1], out=ds)
+    dt = _scratch('time_diff', len(t_ns) - 1, np.float64)
+    np.subtract(t_ns[1:], t_ns[:-1], out=dt)
+    dt *= 1e-9
+
+    # Braking events: brake applied while speed is decreasing
+    mask = (brake[1:] > 0) & (ds < 0)
+
+    if not mask.any():
         return 0.0
 
+    # Deceleration in m/s^2 (speed is km/h), expressed as G-force
+    decel = -(ds / 3.6) / dt
+    return float(decel[mask].mean() / 9.81)
+
 def calculate_throttle_smoothness(telemetry):
     """Calculate throttle application smoothness (lower std = smoother)"""
-    try:
-        throttle_changes = telemetry['Throttle'].diff().abs()
-        return throttle_changes.std()
-    except:
+    if not _telemetry_ok(telemetry):
         return 0.0
 
+    throttle = telemetry['Throttle'].to_numpy(np.float32)
+    throttle_changes = _scratch('throttle_diff', len(throttle) - 1, np.float32)
+    np.subtract(throttle[1:], throttle[:-1], out=throttle_changes)
+    np.abs(throttle_changes, out=throttle_changes)
+    # ddof=1 matches pandas; accumulate in float64 for a stable reduction
+    return float(throttle_changes.std(ddof=1, dtype=np.float64))
+
 def calculate_cornering_consistency(telemetry):
     """Calculate cornering consistency based on speed variance in corners"""
-    try:
-        # Identify cornering sections (low throttle, high steering)
-        corner_mask = (telemetry['Throttle'] < 50) & (abs(telemetry['Speed'].diff()) > 1)
-        
-        if not corner_mask.any():
-            return 0.0
-        
-        corner_speeds = telemetry.loc[corner_mask, 'Speed']
-        return corner_speeds.std()
-    except:
+    if not _telemetry_ok(telemetry):
+        return 0.0
+
+    # float32 halves the bytes moved; this mask/reduce is memory-bound
+    speed = telemetry['Speed'].to_numpy(np.float32)
+    throttle = telemetry['Throttle'].to_numpy(np.float32)
+
+    ds = _scratch('corner_diff', len(speed), np.float32)
+    ds[0] = 0.0
+    np.subtract(speed[1:], speed[:-1], out=ds[1:])
+
+    # Cornering sections (low throttle, high steering)
+    mask = (throttle < 50.0) & (np.abs(ds) > 1.0)
+
+    if not mask.any():
         return 0.0
 
+    return float(speed[mask].std(ddof=1, dtype=np.float64))
+
 def calculate_gear_shift_frequency(telemetry):
     """Calculate gear shift frequency per minute"""
-    try:
-        gear_changes = (telemetry['nGear'].diff() != 0).sum()
-        total_time_minutes = (telemetry['Time'].iloc[-1] - telemetry['Time'].iloc[0]).total_seconds() / 60
-        
-        if total_time_minutes > 0:
-            return gear_changes / total_time_minutes
-        return 0.0
-    except:
+    if not _telemetry_ok(telemetry):
         return 0.0
 
-def analyze_driver_style(session, driver_code):
+    # Integer compare on the raw array: one pass, no NaN, no float upcast
+    gear = telemetry['nGear'].to_numpy()
+    gear_changes = int(np.count_nonzero(gear[1:] != gear[:-1]))
+
+    t_ns = telemetry['Time'].iloc[[-1, 0]].to_numpy('timedelta64[ns]').view('int64')
+    total_time_minutes = (t_ns[0] - t_ns[1]) * 1e-9 / 60
+
+    if total_time_minutes > 0:
+        return gear_changes / total_time_minutes
+    return 0.0
+
+def analyze_driver_style(year, gp, session_type, driver_code):
     """Analyze a driver's style metrics"""
-    telemetry, lap = get_driver_telemetry(session, driver_code)
-    
-    if telemetry is None or telemetry.empty:
+    cached = _lookup_metrics(year, gp, session_type, driver_code)
+    if cached is not None:
+        return cached
+
+    telemetry, lap = get_driver_telemetry(year, gp, session_type, driver_code)
+
+    if telemetry is None or not _telemetry_ok(telemetry):
         return None
-    
-    metrics = {
-        'braking_aggressiveness': calculate_braking_aggressiveness(telemetry),
-        'throttle_smoothness': calculate_throttle_smoothness(telemetry),
-        'cornering_consistency': calculate_cornering_consistency(telemetry),
-        'gear_shift_frequency': calculate_gear_shift_frequency(telemetry)
-    }
-    
+
+    if compute_metrics is not None:
+        # Single fused pass over the raw arrays instead of four DataFrame
+        # scans; the columns are already downcast so these are zero-copy views
+        speed = telemetry['Speed'].to_numpy()
+        brake = telemetry['Brake'].to_numpy()
+        throttle = telemetry['Throttle'].to_numpy()
+        ngear = telemetry['nGear'].to_numpy()
+        t_s = _time_ns(telemetry) * 1e-9
+
+        braking_g, throttle_std, corner_std, gear_freq = compute_metrics(
+            speed, brake, throttle, ngear, t_s)
+
+        metrics = {
+            'braking_aggressiveness': float(braking_g),
+            'throttle_smoothness': float(throttle_std),
+            'cornering_consistency': float(corner_std),
+            'gear_shift_frequency': float(gear_freq)
+        }
+    elif compute_metrics_lazy is not None:
+        braking_g, throttle_std, corner_std, gear_freq = compute_metrics_lazy(telemetry)
+
+        metrics = {
+            'braking_aggressiveness': braking_g,
+            'throttle_smoothness': throttle_std,
+            'cornering_consistency': corner_std,
+            'gear_shift_frequency': gear_freq
+        }
+    else:
+        metrics = {
+            'braking_aggressiveness': calculate_braking_aggressiveness(telemetry),
+            'throttle_smoothness': calculate_throttle_smoothness(telemetry),
+            'cornering_consistency': calculate_cornering_consistency(telemetry),
+            'gear_shift_frequency': calculate_gear_shift_frequency(telemetry)
+        }
+
+    _store_metrics(year, gp, session_type, driver_code, metrics, lap)
     return metrics, lap
 
+def _analyze_worker(year, gp, session_type, driver_code):
+    """Run analyze_driver_style in a worker thread, capturing errors
+
+    Returns (True, result) or (False, error message); st.* calls happen
+    back on the main thread.
+    """
+    try:
+        return True, analyze_driver_style(year, gp, session_type, driver_code)
+    except Exception as e:
+        return False, str(e)
+
+def _render_driver_metrics(placeholder, driver_code, metrics, other_metrics=None):
+    """Render one driver's metrics into its placeholder
+
+    Called once as soon as the driver's analysis resolves, then again with
+    other_metrics to fill in the deltas once both drivers are in.
+    """
+    def delta(name):
+        if other_metrics is None:
+            return None
+        return f"{metrics[name] - other_metrics[name]:.2f}"
+
+    with placeholder.container():
+        st.markdown(f"**{driver_code}**")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric(
+                "Braking Aggressiveness (G)",
+                f"{metrics['braking_aggressiveness']:.2f}",
+                delta=delta('braking_aggressiveness')
+            )
+            st.metric(
+                "Cornering Consistency",
+                f"{metrics['cornering_consistency']:.2f}",
+                delta=delta('cornering_consistency'),
+                delta_color="inverse"
+            )
+        with col2:
+            st.metric(
+                "Throttle Smoothness",
+                f"{metrics['throttle_smoothness']:.2f}",
+                delta=delta('throttle_smoothness'),
+                delta_color="inverse"
+            )
+            st.metric(
+                "Gear Shifts/Min",
+                f"{metrics['gear_shift_frequency']:.2f}",
+                delta=delta('gear_shift_frequency')
+            )
+
+@st.cache_data(show_spinner=False)
 def create_comparison_charts(driver1_data, driver2_data, driver1_name, driver2_name):
-    """Create comparison visualizations"""
-    
+    """Create comparison visualizations, cached on the metric values and names"""
+    import plotly.express as px
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     # Prepare data for charts
     metrics_names = ['Braking\nAggressiveness (G)', 'Throttle\nSmoothness', 'Cornering\nConsistency', 'Gear Shifts\nper Min']
     driver1_values = [
@@ -177,17 +415,17 @@ def create_comparison_charts(driver1_data, driver2_data, driver1_name, driver2_n
         specs=[[{"secondary_y": False}, {"type": "polar"}]]
     )
     
-    # Bar chart comparison
-    fig.add_trace(
-        go.Bar(name=driver1_name, x=metrics_names, y=driver1_values, 
-               marker_color='#FF6B6B', opacity=0.8),
-        row=1, col=1
-    )
-    fig.add_trace(
-        go.Bar(name=driver2_name, x=metrics_names, y=driver2_values,
-               marker_color='#4ECDC4', opacity=0.8),
-        row=1, col=1
-    )
+    # Bar chart comparison: one grouped px.bar sharing a single x array
+    # instead of two hand-built traces
+    df_plot = pd.DataFrame({
+        'metric': metrics_names * 2,
+        'value': driver1_values + driver2_values,
+        'driver': [driver1_name] * 4 + [driver2_name] * 4
+    })
+    bars = px.bar(df_plot, x='metric', y='value', color='driver', barmode='group',
+                  color_discrete_sequence=['#FF6B6B', '#4ECDC4'], opacity=0.8)
+    for trace in bars.data:
+        fig.add_trace(trace, row=1, col=1)
     
     # Radar chart for style fingerprint
     fig.add_trace(
@@ -235,8 +473,7 @@ def main():
     
     # GP selection
     try:
-        schedule = fastf1.get_event_schedule(selected_year)
-        gp_names = schedule['EventName'].tolist()
+        gp_names = _schedule(selected_year)
         selected_gp = st.sidebar.selectbox("Select Grand Prix", gp_names)
     except:
         st.error("Failed to load season schedule. Please try again.")
@@ -252,12 +489,16 @@ def main():
     # Load session data
     if st.sidebar.button("Load Session Data"):
         with st.spinner("Loading session data..."):
-            session = load_session_data(selected_year, selected_gp, selected_session)
-            st.session_state['session'] = session
-            
-            if session:
+            try:
+                laps = load_session_data(selected_year, selected_gp, selected_session)
+            except Exception as e:
+                st.error(f"Error loading session data: {str(e)}")
+                laps = None
+
+            if laps is not None:
+                st.session_state['session_key'] = (selected_year, selected_gp, selected_session)
                 # Get available drivers
-                drivers = session.laps['Driver'].unique()
+                drivers = laps['Driver'].unique()
                 st.session_state['drivers'] = sorted(drivers)
                 st.success(f"✅ Loaded {selected_session} data for {selected_gp} {selected_year}")
     
@@ -277,105 +518,109 @@ def main():
                 st.error("Please select two different drivers for comparison.")
                 return
             
-            session = st.session_state['session']
-            
-            with st.spinner("Analyzing driver styles..."):
-                # Analyze both drivers
-                driver1_result = analyze_driver_style(session, driver1)
-                driver2_result = analyze_driver_style(session, driver2)
-                
-                if driver1_result is None or driver2_result is None:
-                    st.error("Failed to analyze one or both drivers. Please try different drivers or session.")
-                    return
-                
-                driver1_metrics, driver1_lap = driver1_result
-                driver2_metrics, driver2_lap = driver2_result
-                
-                # Display results
-                st.header(f"Driver Comparison: {driver1} vs {driver2}")
-                
-                # Context information
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.info(f"**Season:** {selected_year}")
-                with col2:
-                    st.info(f"**Grand Prix:** {selected_gp}")
-                with col3:
-                    st.info(f"**Session:** {selected_session}")
-                
-                # Metrics display
-                st.subheader("📊 Style Metrics Comparison")
-                
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric(
-                        "Braking Aggressiveness (G)",
-                        f"{driver1_metrics['braking_aggressiveness']:.2f}",
-                        delta=f"{driver1_metrics['braking_aggressiveness'] - driver2_metrics['braking_aggressiveness']:.2f}"
-                    )
-                    st.caption(f"{driver2}: {driver2_metrics['braking_aggressiveness']:.2f}")
-                
-                with col2:
-                    st.metric(
-                        "Throttle Smoothness",
-                        f"{driver1_metrics['throttle_smoothness']:.2f}",
-                        delta=f"{driver1_metrics['throttle_smoothness'] - driver2_metrics['throttle_smoothness']:.2f}",
-                        delta_color="inverse"
-                    )
-                    st.caption(f"{driver2}: {driver2_metrics['throttle_smoothness']:.2f}")
-                
-                with col3:
-                    st.metric(
-                        "Cornering Consistency",
-                        f"{driver1_metrics['cornering_consistency']:.2f}",
-                        delta=f"{driver1_metrics['cornering_consistency'] - driver2_metrics['cornering_consistency']:.2f}",
-                        delta_color="inverse"
-                    )
-                    st.caption(f"{driver2}: {driver2_metrics['cornering_consistency']:.2f}")
-                
-                with col4:
-                    st.metric(
-                        "Gear Shifts/Min",
-                        f"{driver1_metrics['gear_shift_frequency']:.2f}",
-                        delta=f"{driver1_metrics['gear_shift_frequency'] - driver2_metrics['gear_shift_frequency']:.2f}"
-                    )
-                    st.caption(f"{driver2}: {driver2_metrics['gear_shift_frequency']:.2f}")
-                
-                # Visualization
-                st.subheader("📈 Visual Comparison")
+            year, gp, session_type = st.session_state['session_key']
+
+            # Short-circuit when the exact same comparison was just rendered
+            analysis_key = (year, gp, session_type, driver1, driver2)
+            cached_run = (st.session_state.get('last_key') == analysis_key
+                          and 'last_fig' in st.session_state)
+
+            # Display results
+            st.header(f"Driver Comparison: {driver1} vs {driver2}")
+
+            # Context information
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.info(f"**Season:** {selected_year}")
+            with col2:
+                st.info(f"**Grand Prix:** {selected_gp}")
+            with col3:
+                st.info(f"**Session:** {selected_session}")
+
+            # Metrics display
+            st.subheader("📊 Style Metrics Comparison")
+            if cached_run:
+                driver1_metrics, driver2_metrics = st.session_state['last_metrics']
+                driver1_lap, driver2_lap = st.session_state['last_laps']
+                metric_cols = st.columns(2)
+                _render_driver_metrics(metric_cols[0].empty(), driver1, driver1_metrics, driver2_metrics)
+                _render_driver_metrics(metric_cols[1].empty(), driver2, driver2_metrics, driver1_metrics)
+            else:
+                metric_cols = st.columns(2)
+                placeholders = {}
+                for column, driver_code in zip(metric_cols, (driver1, driver2)):
+                    placeholders[driver_code] = column.empty()
+                    placeholders[driver_code].info(f"Analyzing {driver_code}...")
+
+                results = {}
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    futures = {executor.submit(_analyze_worker, year, gp, session_type, d): d
+                               for d in (driver1, driver2)}
+                    for future in as_completed(futures):
+                        driver_code = futures[future]
+                        ok, result = future.result()
+                        results[driver_code] = (ok, result)
+                        if ok and result is not None:
+                            _render_driver_metrics(placeholders[driver_code], driver_code, result[0])
+
+                for driver_code in (driver1, driver2):
+                    ok, result = results[driver_code]
+                    if not ok:
+                        st.error(f"Error getting telemetry for {driver_code}: {result}")
+                        return
+                    if result is None:
+                        st.error("Failed to analyze one or both drivers. Please try different drivers or session.")
+                        return
+
+                driver1_metrics, driver1_lap = results[driver1][1]
+                driver2_metrics, driver2_lap = results[driver2][1]
+
+                # Fill in the deltas now that both drivers have resolved
+                _render_driver_metrics(placeholders[driver1], driver1, driver1_metrics, driver2_metrics)
+                _render_driver_metrics(placeholders[driver2], driver2, driver2_metrics, driver1_metrics)
+
+                st.session_state['last_key'] = analysis_key
+                st.session_state['last_metrics'] = (driver1_metrics, driver2_metrics)
+                st.session_state['last_laps'] = (driver1_lap, driver2_lap)
+
+            # Visualization
+            st.subheader("📈 Visual Comparison")
+            if cached_run:
+                fig = st.session_state['last_fig']
+            else:
                 fig = create_comparison_charts(driver1_metrics, driver2_metrics, driver1, driver2)
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Lap time comparison
-                st.subheader("⏱️ Lap Time Comparison")
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.info(f"**{driver1}** - Lap Time: {driver1_lap['LapTime']}")
-                with col2:
-                    st.info(f"**{driver2}** - Lap Time: {driver2_lap['LapTime']}")
-                
-                # Style interpretation
-                st.subheader("🎯 Style Analysis Summary")
-                
-                # Determine style characteristics
-                if driver1_metrics['braking_aggressiveness'] > driver2_metrics['braking_aggressiveness']:
-                    braking_leader = driver1
-                else:
-                    braking_leader = driver2
-                
-                if driver1_metrics['throttle_smoothness'] < driver2_metrics['throttle_smoothness']:
-                    smooth_leader = driver1
-                else:
-                    smooth_leader = driver2
-                
-                st.markdown(f"""
-                **Key Insights:**
-                - **Most Aggressive Braker:** {braking_leader} shows higher deceleration forces
-                - **Smoothest Throttle Application:** {smooth_leader} demonstrates more consistent throttle inputs
-                - **Driving Style Differences:** The radar chart shows each driver's unique signature across all metrics
-                """)
+                st.session_state['last_fig'] = fig
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Lap time comparison
+            st.subheader("⏱️ Lap Time Comparison")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.info(f"**{driver1}** - Lap Time: {driver1_lap['LapTime']}")
+            with col2:
+                st.info(f"**{driver2}** - Lap Time: {driver2_lap['LapTime']}")
+            
+            # Style interpretation
+            st.subheader("🎯 Style Analysis Summary")
+            
+            # Determine style characteristics
+            if driver1_metrics['braking_aggressiveness'] > driver2_metrics['braking_aggressiveness']:
+                braking_leader = driver1
+            else:
+                braking_leader = driver2
+            
+            if driver1_metrics['throttle_smoothness'] < driver2_metrics['throttle_smoothness']:
+                smooth_leader = driver1
+            else:
+                smooth_leader = driver2
+            
+            st.markdown(f"""
+            **Key Insights:**
+            - **Most Aggressive Braker:** {braking_leader} shows higher deceleration forces
+            - **Smoothest Throttle Application:** {smooth_leader} demonstrates more consistent throttle inputs
+            - **Driving Style Differences:** The radar chart shows each driver's unique signature across all metrics
+            """)
     
     else:
         st.info("👈 Please load session data first using the sidebar controls.")